@@ -3,9 +3,10 @@
 async_resume_downloader.py — Download one or more resume PDFs from public
 URLs using asyncio, with progress reporting, retry logic, and PDF validation.
 
-Uses ONLY the Python standard library (asyncio + urllib.request). Blocking
-I/O is offloaded to a thread-pool via asyncio.to_thread so downloads run
-concurrently without third-party async HTTP libraries.
+When ``aiohttp`` is installed, responses are streamed directly on the event
+loop through one shared ``ClientSession``.  Otherwise the script falls back to
+the Python standard library (urllib.request), offloading blocking I/O to a
+thread-pool via asyncio.to_thread.  The CLI runs on ``uvloop`` if installed.
 
 Usage:
     # Single URL
@@ -27,16 +28,26 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
 import os
 import re
 import ssl
 import sys
-import time
 from pathlib import Path
 from urllib.error import HTTPError, URLError
 from urllib.parse import unquote, urlparse
 from urllib.request import Request, urlopen
 
+try:
+    import aiohttp
+except ImportError:  # stdlib fallback: urllib.request in a thread-pool
+    aiohttp = None
+
+try:
+    import uvloop
+except ImportError:  # not installed, or Windows: default asyncio event loop
+    uvloop = None
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -45,7 +56,7 @@ MAX_CONCURRENT = 5           # semaphore limit for parallel downloads
 MAX_RETRIES = 3              # retry attempts per URL
 RETRY_BACKOFF = 1.5          # exponential back-off base (seconds)
 TIMEOUT_SECONDS = 60         # socket-level timeout per request
-CHUNK_SIZE = 64 * 1024       # 64 KB streaming chunks
+CHUNK_SIZE = 1 << 20         # 1 MiB streaming chunks
 MAX_FILE_SIZE = 50_000_000   # 50 MB safety cap per file
 PDF_MAGIC = b"%PDF"          # first 4 bytes of every valid PDF
 USER_AGENT = "ResumeDownloader/1.0 (Python-urllib)"
@@ -69,37 +80,56 @@ def sanitize_filename(url: str, index: int) -> str:
     return basename
 
 
-def validate_pdf(filepath: Path) -> bool:
-    """Return True if the file begins with the ``%PDF`` magic bytes."""
-    try:
-        with open(filepath, "rb") as fh:
-            return fh.read(4) == PDF_MAGIC
-    except OSError:
-        return False
+def check_pdf_magic(head: bytes) -> None:
+    """Raise ``ValueError`` unless *head* begins with the ``%PDF`` magic bytes.
+
+    Called on the first bytes of the response stream, so non-PDF payloads
+    are rejected before anything is written to disk.
+    """
+    if not head.startswith(PDF_MAGIC):
+        raise ValueError(
+            "Downloaded file is not a valid PDF (missing %PDF header)"
+        )
+
+
+def _open_dest(dest: Path) -> int:
+    """Open *dest* for writing as a raw, unbuffered file descriptor.
+
+    Chunks are already sized by ``CHUNK_SIZE``, so a Python-level write
+    buffer would only add a second copy on top of the kernel page cache.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    return os.open(dest, flags, 0o644)
+
 
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of *data* to *fd*, looping over short ``os.write`` calls."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
-def _build_ssl_context() -> ssl.SSLContext:
-    """Create a default SSL context for HTTPS requests."""
-    ctx = ssl.create_default_context()
-    return ctx
+
+# Loading the system CA bundle is expensive, so every download (and every
+# retry) shares one context instead of building its own.
+_SSL_CTX = ssl.create_default_context()
 
 
 # ---------------------------------------------------------------------------
-# Blocking download (runs inside a thread)
+# Blocking download (stdlib fallback, runs inside a thread)
 # ---------------------------------------------------------------------------
 
 def _download_blocking(url: str, dest: Path) -> int:
     """Synchronous download of *url* into *dest*.
 
     Streams the response in chunks to keep memory usage low and enforces
-    the ``MAX_FILE_SIZE`` limit.  Returns the number of bytes written.
+    the ``MAX_FILE_SIZE`` limit.  The ``%PDF`` magic is checked on the
+    first bytes before *dest* is opened.  Returns the number of bytes written.
 
     This function is intended to be called via ``asyncio.to_thread``.
     """
     req = Request(url, headers={"User-Agent": USER_AGENT})
-    ctx = _build_ssl_context()
 
-    with urlopen(req, timeout=TIMEOUT_SECONDS, context=ctx) as resp:
+    with urlopen(req, timeout=TIMEOUT_SECONDS, context=_SSL_CTX) as resp:
         # Honour Content-Length if the server provides it
         content_length = resp.headers.get("Content-Length")
         if content_length and int(content_length) > MAX_FILE_SIZE:
@@ -108,8 +138,13 @@ def _download_blocking(url: str, dest: Path) -> int:
                 f"> {MAX_FILE_SIZE:,} byte limit)"
             )
 
-        downloaded = 0
-        with open(dest, "wb") as fh:
+        head = resp.read(len(PDF_MAGIC))
+        check_pdf_magic(head)
+
+        downloaded = len(head)
+        fd = _open_dest(dest)
+        try:
+            _write_all(fd, head)
             while True:
                 chunk = resp.read(CHUNK_SIZE)
                 if not chunk:
@@ -119,11 +154,98 @@ def _download_blocking(url: str, dest: Path) -> int:
                     raise ValueError(
                         f"Download exceeded {MAX_FILE_SIZE:,} byte limit"
                     )
-                fh.write(chunk)
+                _write_all(fd, chunk)
+        finally:
+            os.close(fd)
+
+    return downloaded
+
+
+# ---------------------------------------------------------------------------
+# Async download (aiohttp, runs on the event loop)
+# ---------------------------------------------------------------------------
+
+def _open_session(max_concurrent: int):
+    """Return an async context manager yielding the shared HTTP session.
+
+    Yields ``None`` when aiohttp is not installed, which makes
+    ``download_one`` use the thread-pool fallback.
+    """
+    if aiohttp is None:
+        return contextlib.nullcontext()
+
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrent,
+        limit_per_host=max_concurrent,
+        ssl=_SSL_CTX,
+    )
+    timeout = aiohttp.ClientTimeout(
+        sock_connect=TIMEOUT_SECONDS,
+        sock_read=TIMEOUT_SECONDS,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={"User-Agent": USER_AGENT},
+        trust_env=True,  # honour HTTP(S)_PROXY like urllib does
+    )
+
+
+async def _download_async(session: aiohttp.ClientSession, url: str,
+                          dest: Path) -> int:
+    """Asynchronous download of *url* into *dest* using *session*.
+
+    Same streaming and ``MAX_FILE_SIZE`` behaviour as ``_download_blocking``,
+    but chunks are read on the event loop without a thread hop, and the
+    session's connection pool keeps sockets alive across URLs and retries.
+    """
+    async with session.get(url) as resp:
+        if not resp.ok:
+            # Drain short error bodies so the keep-alive socket goes back
+            # to the pool and the retry skips a fresh TCP/TLS handshake.
+            if resp.content_length is not None \
+                    and resp.content_length <= CHUNK_SIZE:
+                await resp.read()
+            resp.raise_for_status()
+
+        content_length = resp.content_length
+        if content_length and content_length > MAX_FILE_SIZE:
+            raise ValueError(
+                f"File too large ({content_length:,} bytes "
+                f"> {MAX_FILE_SIZE:,} byte limit)"
+            )
+
+        try:
+            head = await resp.content.readexactly(len(PDF_MAGIC))
+        except asyncio.IncompleteReadError as exc:
+            head = exc.partial
+        check_pdf_magic(head)
+
+        downloaded = len(head)
+        fd = _open_dest(dest)
+        try:
+            _write_all(fd, head)
+            async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                downloaded += len(chunk)
+                if downloaded > MAX_FILE_SIZE:
+                    raise ValueError(
+                        f"Download exceeded {MAX_FILE_SIZE:,} byte limit"
+                    )
+                _write_all(fd, chunk)
+        finally:
+            os.close(fd)
 
     return downloaded
 
 
+# Exceptions that count as a failed attempt (and trigger a retry)
+_DOWNLOAD_ERRORS: tuple[type[BaseException], ...] = (
+    HTTPError, URLError, ValueError, OSError, asyncio.TimeoutError,
+)
+if aiohttp is not None:
+    _DOWNLOAD_ERRORS += (aiohttp.ClientError,)
+
+
 # ---------------------------------------------------------------------------
 # Async wrapper with retry + validation
 # ---------------------------------------------------------------------------
@@ -132,9 +254,15 @@ async def download_one(
     url: str,
     dest: Path,
     semaphore: asyncio.Semaphore,
+    session: aiohttp.ClientSession | None = None,
 ) -> dict:
     """Download a single PDF with concurrency control, retries, and validation.
 
+    Uses *session* when given; otherwise falls back to the blocking urllib
+    downloader in a thread-pool.  Every attempt writes to ``<dest>.part``,
+    which is renamed to *dest* only once a download completes, so a partial
+    file never appears at the final path.
+
     Returns::
 
         {
@@ -155,43 +283,32 @@ async def download_one(
         "error": None,
     }
 
+    loop = asyncio.get_running_loop()
+    part = dest.with_name(dest.name + ".part")
+
     async with semaphore:
         for attempt in range(1, MAX_RETRIES + 1):
-            t0 = time.monotonic()
+            t0 = loop.time()
             try:
-                # Offload blocking I/O to the default thread-pool
-                downloaded = await asyncio.to_thread(
-                    _download_blocking, url, dest,
-                )
-                elapsed = time.monotonic() - t0
-
-                # Validate the file is a real PDF
-                if not validate_pdf(dest):
-                    dest.unlink(missing_ok=True)
-                    raise ValueError(
-                        "Downloaded file is not a valid PDF "
-                        "(missing %PDF header)"
+                if session is not None:
+                    downloaded = await _download_async(session, url, part)
+                else:
+                    # Offload blocking I/O to the default thread-pool
+                    downloaded = await asyncio.to_thread(
+                        _download_blocking, url, part,
                     )
-
+                os.replace(part, dest)
                 result.update(
                     success=True,
                     size_bytes=downloaded,
-                    elapsed=round(elapsed, 2),
-                )
-                print(
-                    f"  ✅  {dest.name}  "
-                    f"({downloaded:,} bytes in {elapsed:.1f}s)"
+                    elapsed=round(loop.time() - t0, 2),
                 )
                 return result
 
-            except (HTTPError, URLError, ValueError, OSError) as exc:
-                elapsed = time.monotonic() - t0
-                result["elapsed"] = round(elapsed, 2)
+            except _DOWNLOAD_ERRORS as exc:
+                result["elapsed"] = round(loop.time() - t0, 2)
                 result["error"] = str(exc)
 
-                # Remove any partial file
-                dest.unlink(missing_ok=True)
-
                 if attempt < MAX_RETRIES:
                     wait = RETRY_BACKOFF ** attempt
                     print(
@@ -199,11 +316,10 @@ async def download_one(
                         f"{dest.name}: {exc}  — retrying in {wait:.1f}s"
                     )
                     await asyncio.sleep(wait)
-                else:
-                    print(
-                        f"  ❌  {dest.name}  FAILED after "
-                        f"{MAX_RETRIES} attempts: {exc}"
-                    )
+
+        # Retries truncate and reuse the .part file; clean it up only once
+        # every attempt has failed.
+        part.unlink(missing_ok=True)
 
     return result
 
@@ -246,11 +362,27 @@ async def download_resumes(
 
     print(f"Downloading {len(urls)} resume(s) → {output_path.resolve()}/\n")
 
-    tasks = [
-        download_one(url, dest, semaphore)
-        for url, dest in download_pairs
-    ]
-    results = await asyncio.gather(*tasks)
+    async with _open_session(max_concurrent) as session:
+        tasks = [
+            download_one(url, dest, semaphore, session)
+            for url, dest in download_pairs
+        ]
+        results = await asyncio.gather(*tasks)
+
+    # Per-file outcomes are reported once, after all downloads have finished
+    lines = []
+    for r in results:
+        name = Path(r["path"]).name
+        if r["success"]:
+            lines.append(
+                f"  ✅  {name}  ({r['size_bytes']:,} bytes in {r['elapsed']:.1f}s)"
+            )
+        else:
+            lines.append(
+                f"  ❌  {name}  FAILED after {MAX_RETRIES} attempts: {r['error']}"
+            )
+    if lines:
+        print("\n".join(lines))
 
     # Print summary
     ok = sum(1 for r in results if r["success"])
@@ -289,7 +421,9 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    results = asyncio.run(
+    # uvloop.run rather than the deprecated uvloop.install() policy hook
+    run = uvloop.run if uvloop is not None else asyncio.run
+    results = run(
         download_resumes(args.urls, args.output_dir, args.max_concurrent)
     )
 
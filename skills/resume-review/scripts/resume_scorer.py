@@ -13,18 +13,40 @@ Arguments:
     output_json           Path to write extracted candidate data as JSON
 """
 
+import functools
 import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+try:
+    from pypdf import PdfReader
+except ImportError:  # extract_text falls back to pdfplumber
+    PdfReader = None
+
+try:
+    import ahocorasick
+except ImportError:  # extract_awards falls back to per-line substring checks
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # process_resumes falls back to stdlib json
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # PDF text extraction
 # ---------------------------------------------------------------------------
 
+# pypdf output shorter than this (scanned pages, odd encodings) is retried
+# with pdfplumber's slower layout analysis.
+MIN_PYPDF_TEXT_LENGTH = 100
+
+
 def extract_text_pdfplumber(pdf_path):
-    """Primary extractor using pdfplumber."""
+    """Fallback extractor using pdfplumber (layout-aware, slower)."""
     try:
         import pdfplumber
         text = ""
@@ -39,9 +61,10 @@ def extract_text_pdfplumber(pdf_path):
 
 
 def extract_text_pypdf(pdf_path):
-    """Fallback extractor using pypdf."""
+    """Primary extractor using pypdf (fast, no layout analysis)."""
+    if PdfReader is None:
+        return ""
     try:
-        from pypdf import PdfReader
         reader = PdfReader(pdf_path)
         return "\n".join(page.extract_text() or "" for page in reader.pages).strip()
     except Exception:
@@ -49,10 +72,10 @@ def extract_text_pypdf(pdf_path):
 
 
 def extract_text(pdf_path):
-    """Extract text with pdfplumber; fall back to pypdf if empty."""
-    text = extract_text_pdfplumber(pdf_path)
-    if not text:
-        text = extract_text_pypdf(pdf_path)
+    """Extract text with pypdf; fall back to pdfplumber if empty or very short."""
+    text = extract_text_pypdf(pdf_path)
+    if len(text) < MIN_PYPDF_TEXT_LENGTH:
+        text = extract_text_pdfplumber(pdf_path) or text
     return text
 
 
@@ -78,6 +101,7 @@ LANGUAGE_ALIASES = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def normalize_language(lang):
     """Return the canonical name for a language, deduplicating aliases."""
     return LANGUAGE_ALIASES.get(lang.lower(), lang)
@@ -85,12 +109,7 @@ def normalize_language(lang):
 
 def deduplicate_languages(lang_list):
     """Deduplicate a list of languages using canonical names."""
-    seen = {}
-    for lang in lang_list:
-        canonical = normalize_language(lang)
-        if canonical not in seen:
-            seen[canonical] = lang  # keep first form encountered
-    return list(seen.keys())
+    return list(dict.fromkeys(normalize_language(lang) for lang in lang_list))
 
 
 # ---------------------------------------------------------------------------
@@ -126,24 +145,85 @@ AWARD_KEYWORDS = [
     "won", "winner", "finalist", "placed", "rank",
 ]
 
+
+def _build_award_automaton():
+    """Build an Aho–Corasick automaton over AWARD_KEYWORDS, or None."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in AWARD_KEYWORDS:
+        automaton.add_word(kw.lower(), kw)
+    automaton.make_automaton()
+    return automaton
+
+
+AWARD_AUTOMATON = _build_award_automaton()
+AWARD_KEYWORDS_LOWER = tuple(kw.lower() for kw in AWARD_KEYWORDS)
+
 # Lines starting with these patterns are unlikely to be a person's name.
 NAME_BLACKLIST_PATTERNS = [
     r'^(resume|curriculum\s*vitae|cv|objective|summary|profile|contact)',
     r'^(http|www|phone|email|address|linkedin|github)',
 ]
 
+# Every fixed pattern is compiled once at import; the extractors run per
+# resume (and per line), so per-call compilation/cache lookups add up.
+NAME_BLACKLIST_RE = [re.compile(pat, re.I) for pat in NAME_BLACKLIST_PATTERNS]
+CONTACT_RE = re.compile(r'@|\.com|\.org|\.edu|\d{3}[\-\.]\d{3}|\d{5}')
+
+GITHUB_RES = [
+    re.compile(r'github\.com/([A-Za-z0-9_-]+)(?:[/\s?#]|$)', re.I),
+    re.compile(r'GitHub\s*:\s*(?:https?://)?(?:www\.)?github\.com/([A-Za-z0-9_-]+)', re.I),
+    re.compile(r'GitHub\s*:\s*@?([A-Za-z0-9_-]+)', re.I),
+]
+
+# One pass finds both explicit statements ("10+ years of experience", group 1)
+# and date ranges ("Jan 2018 - Present", groups 2-3).  Only the explicit
+# branch is case-insensitive; month names in ranges must be capitalised.
+YEARS_RE = re.compile(
+    r'(?i:(\d+)\+?\s*years?\s*(?:of\s+)?(?:professional\s+)?(?:experience|exp))'
+    r'|(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?'
+    r'(\d{4})\s*[-–—]+\s*'
+    r'(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?'
+    r'(\d{4}|[Pp]resent|[Cc]urrent|[Nn]ow)'
+)
+
+# Fallback reference year for "- Present" ranges; process_resumes passes the
+# year explicitly so a long-lived import does not go stale.
+_CURRENT_YEAR = datetime.now().year
+
+# Job description year ranges: "3-5 years", "3 to 5 years", "up to 5 years", "5+ years"
+JD_RANGE_RE = re.compile(r'(\d+)\s*[-–—]\s*(\d+)\s*(?:\+?\s*)?years?', re.I)
+JD_RANGE2_RE = re.compile(r'(\d+)\s+to\s+(\d+)\s*(?:\+?\s*)?years?', re.I)
+JD_MAX_RE = re.compile(
+    r'(?:at most|up to|no more than|maximum of?|max)\s*(\d+)\s*years?', re.I
+)
+JD_MIN_RE = re.compile(r'(\d+)\+?\s*years?', re.I)
+
+DEGREE_RES = [
+    re.compile(r"\b(Ph\.?D\.?|Doctor(?:ate)?)\s+(?:in|of)\s+[\w\s]{3,40}", re.I),
+    re.compile(r"\b(Master'?s?|M\.S\.?|M\.A\.?|M\.Eng\.?|MBA)\s+(?:in|of)\s+[\w\s]{3,40}", re.I),
+    re.compile(r"\b(Bachelor'?s?|B\.S\.?|B\.A\.?|B\.Eng\.?|B\.Tech)\s+(?:in|of)\s+[\w\s]{3,40}", re.I),
+    re.compile(r"\b(Associate'?s?|A\.S\.?|A\.A\.?)\s+(?:in|of)\s+[\w\s]{3,40}", re.I),
+]
+
 
-def extract_name(text):
-    """Heuristic: first non-empty, non-header, non-contact line is the name."""
-    for line in text.split("\n"):
+def extract_name(text, lines=None):
+    """Heuristic: first non-empty, non-header, non-contact line is the name.
+
+    *lines* may be passed in when the caller has already split *text*.
+    """
+    if lines is None:
+        lines = text.split("\n")
+    for line in lines:
         line = line.strip()
         if not line or len(line) > 60:
             continue
         # Skip common resume headers
-        if any(re.match(pat, line, re.I) for pat in NAME_BLACKLIST_PATTERNS):
+        if any(pat.match(line) for pat in NAME_BLACKLIST_RE):
             continue
         # Skip lines that look like contact info
-        if re.search(r'@|\.com|\.org|\.edu|\d{3}[\-\.]\d{3}|\d{5}', line):
+        if CONTACT_RE.search(line):
             continue
         # Skip lines that are ALL CAPS and short (likely section headers)
         if line.isupper() and len(line.split()) <= 2 and len(line) < 20:
@@ -154,16 +234,11 @@ def extract_name(text):
 
 def extract_github(text):
     """Extract GitHub username from resume text."""
-    patterns = [
-        r'github\.com/([A-Za-z0-9_-]+)(?:[/\s?#]|$)',
-        r'GitHub\s*:\s*(?:https?://)?(?:www\.)?github\.com/([A-Za-z0-9_-]+)',
-        r'GitHub\s*:\s*@?([A-Za-z0-9_-]+)',
-    ]
     false_positives = {"in", "com", "io", "org", "profile", "settings",
                        "topics", "explore", "features", "enterprise",
                        "pricing", "login", "join", "about"}
-    for pat in patterns:
-        match = re.search(pat, text, re.IGNORECASE)
+    for pat in GITHUB_RES:
+        match = pat.search(text)
         if match:
             username = match.group(1)
             if username.lower() not in false_positives:
@@ -171,53 +246,68 @@ def extract_github(text):
     return None
 
 
-def extract_languages(text, required_languages=None):
-    """Find programming languages mentioned in the text, with deduplication."""
+@functools.lru_cache(maxsize=None)
+def _keyword_re(keyword, short_case_sensitive):
+    """Compile (once) the regex used to find a single keyword."""
+    if short_case_sensitive and len(keyword) <= 2:
+        # Short names (C, R) — case-sensitive exact word boundary
+        return re.compile(r'(?<![A-Za-z])' + re.escape(keyword) + r'(?![A-Za-z])')
+    return re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
+
+
+def _find_keywords(text, keywords, short_case_sensitive=False, text_lower=None):
+    """Return the entries of *keywords* found in *text*, in list order.
+
+    A plain substring test rules out most keywords before their
+    word-boundary regex has to scan the text.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
     found = []
-    search_list = required_languages if required_languages else COMMON_LANGUAGES
-    for lang in search_list:
-        if len(lang) <= 2:
-            # Short names (C, R) — case-sensitive exact word boundary
-            if re.search(r'(?<![A-Za-z])' + re.escape(lang) + r'(?![A-Za-z])', text):
-                found.append(lang)
+    for kw in keywords:
+        case_sensitive = short_case_sensitive and len(kw) <= 2
+        if case_sensitive:
+            present = kw in text
         else:
-            if re.search(r'\b' + re.escape(lang) + r'\b', text, re.IGNORECASE):
-                found.append(lang)
+            present = kw.lower() in text_lower
+        if present and _keyword_re(kw, short_case_sensitive).search(text):
+            found.append(kw)
+    return found
+
+
+def extract_languages(text, required_languages=None, text_lower=None):
+    """Find programming languages mentioned in the text, with deduplication."""
+    search_list = required_languages if required_languages else COMMON_LANGUAGES
+    found = _find_keywords(text, search_list, short_case_sensitive=True,
+                           text_lower=text_lower)
     return deduplicate_languages(found)
 
 
-def extract_frameworks(text, required_frameworks=None):
+def extract_frameworks(text, required_frameworks=None, text_lower=None):
     """Find frameworks/tools mentioned in the text."""
-    found = []
     search_list = required_frameworks if required_frameworks else COMMON_FRAMEWORKS
-    for fw in search_list:
-        if re.search(r'\b' + re.escape(fw) + r'\b', text, re.IGNORECASE):
-            found.append(fw)
-    return list(set(found))
+    found = _find_keywords(text, search_list, text_lower=text_lower)
+    return list(dict.fromkeys(found))
 
 
-def extract_years_of_experience(text):
+def extract_years_of_experience(text, current_year=_CURRENT_YEAR):
     """Estimate total years of experience, handling overlapping ranges."""
-    # 1. Check for explicit statements like "10+ years" or "10 years of experience"
-    explicit = re.findall(
-        r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:professional\s+)?(?:experience|exp)',
-        text, re.I,
-    )
+    explicit = []
+    year_ranges = []
+    for explicit_y, start_str, end_str in YEARS_RE.findall(text):
+        if explicit_y:
+            explicit.append(int(explicit_y))
+        else:
+            year_ranges.append((start_str, end_str))
+
+    # 1. Explicit statements like "10+ years" or "10 years of experience" win
     if explicit:
-        return max(int(y) for y in explicit)
+        return max(explicit)
 
     # 2. Parse date ranges and merge overlapping intervals
-    year_ranges = re.findall(
-        r'(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?'
-        r'(\d{4})\s*[-–—]+\s*'
-        r'(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?'
-        r'(\d{4}|[Pp]resent|[Cc]urrent|[Nn]ow)',
-        text,
-    )
     if not year_ranges:
         return None
 
-    current_year = datetime.now().year
     intervals = []
     for start_str, end_str in year_ranges:
         start_y = int(start_str)
@@ -228,17 +318,19 @@ def extract_years_of_experience(text):
     if not intervals:
         return None
 
-    # Merge overlapping intervals to avoid double-counting parallel jobs
+    # Merge overlapping intervals to avoid double-counting parallel jobs,
+    # summing each merged span as soon as it closes.
     intervals.sort()
-    merged = [intervals[0]]
-    for start, end in intervals[1:]:
-        prev_start, prev_end = merged[-1]
-        if start <= prev_end:
-            merged[-1] = (prev_start, max(prev_end, end))
+    total = 0
+    cur_start, cur_end = intervals[0]
+    for start, end in intervals:
+        if start <= cur_end:
+            if end > cur_end:
+                cur_end = end
         else:
-            merged.append((start, end))
-
-    total = sum(end - start for start, end in merged)
+            total += cur_end - cur_start
+            cur_start, cur_end = start, end
+    total += cur_end - cur_start
     return total if total > 0 else None
 
 
@@ -249,30 +341,21 @@ def extract_max_years_from_jd(text):
         (min_years, max_years) tuple. max_years may be None if not determinable.
     """
     # Range pattern: "3-5 years", "3–5 years", "3 to 5 years"
-    range_match = re.search(
-        r'(\d+)\s*[-–—]\s*(\d+)\s*(?:\+?\s*)?years?', text, re.I
-    )
+    range_match = JD_RANGE_RE.search(text)
     if range_match:
         return int(range_match.group(1)), int(range_match.group(2))
 
-    range_match2 = re.search(
-        r'(\d+)\s+to\s+(\d+)\s*(?:\+?\s*)?years?', text, re.I
-    )
+    range_match2 = JD_RANGE2_RE.search(text)
     if range_match2:
         return int(range_match2.group(1)), int(range_match2.group(2))
 
     # "at most N years" / "up to N years" / "no more than N years"
-    max_match = re.search(
-        r'(?:at most|up to|no more than|maximum of?|max)\s*(\d+)\s*years?',
-        text, re.I,
-    )
+    max_match = JD_MAX_RE.search(text)
     if max_match:
         return None, int(max_match.group(1))
 
     # Min-only pattern: "5+ years" / "at least 5 years" / "minimum 5 years"
-    min_match = re.search(
-        r'(\d+)\+?\s*years?', text, re.I
-    )
+    min_match = JD_MIN_RE.search(text)
     if min_match:
         min_y = int(min_match.group(1))
         return min_y, min_y * 2  # Default max = min × 2
@@ -280,18 +363,39 @@ def extract_max_years_from_jd(text):
     return None, None
 
 
-def extract_awards(text):
-    """Return list of award-related snippets found in the resume."""
+def extract_awards(text, lines=None, text_lower=None):
+    """Return list of award-related snippets found in the resume.
+
+    With pyahocorasick installed, all keywords are found in one pass over
+    the lower-cased text and each hit is mapped back to its line.
+    *lines* / *text_lower* may be passed in when already computed.
+    """
+    if lines is None:
+        lines = text.split("\n")
+    if AWARD_AUTOMATON is not None:
+        if text_lower is None:
+            text_lower = text.lower()
+        awards = []
+        line_idx, pos, last_idx = 0, 0, -1
+        for end, _kw in AWARD_AUTOMATON.iter(text_lower):
+            # Keywords never contain "\n", so the hit lies on the line
+            # holding its last character.
+            line_idx += text_lower.count("\n", pos, end)
+            pos = end
+            if line_idx != last_idx:
+                awards.append(lines[line_idx].strip())
+                last_idx = line_idx
+        return list(dict.fromkeys(awards))
+
     awards = []
-    for line in text.split("\n"):
+    for line in lines:
         stripped = line.strip()
         if not stripped:
             continue
-        for kw in AWARD_KEYWORDS:
-            if kw.lower() in stripped.lower():
-                awards.append(stripped)
-                break
-    return list(set(awards))
+        stripped_lower = stripped.lower()
+        if any(kw in stripped_lower for kw in AWARD_KEYWORDS_LOWER):
+            awards.append(stripped)
+    return list(dict.fromkeys(awards))
 
 
 def extract_education(text):
@@ -301,14 +405,8 @@ def extract_education(text):
     (e.g. 'systems' falsely matching 'M.S.').
     """
     degrees = []
-    patterns = [
-        r"\b(Ph\.?D\.?|Doctor(?:ate)?)\s+(?:in|of)\s+[\w\s]{3,40}",
-        r"\b(Master'?s?|M\.S\.?|M\.A\.?|M\.Eng\.?|MBA)\s+(?:in|of)\s+[\w\s]{3,40}",
-        r"\b(Bachelor'?s?|B\.S\.?|B\.A\.?|B\.Eng\.?|B\.Tech)\s+(?:in|of)\s+[\w\s]{3,40}",
-        r"\b(Associate'?s?|A\.S\.?|A\.A\.?)\s+(?:in|of)\s+[\w\s]{3,40}",
-    ]
-    for pat in patterns:
-        for match in re.finditer(pat, text, re.IGNORECASE):
+    for pat in DEGREE_RES:
+        for match in pat.finditer(text):
             degrees.append(match.group(0).strip())
     return degrees
 
@@ -317,22 +415,39 @@ def extract_education(text):
 # NLP semantic similarity (optional)
 # ---------------------------------------------------------------------------
 
-def compute_semantic_similarity(jd_text, resume_text):
-    """Compute cosine similarity between JD and resume using sentence-transformers.
+def compute_semantic_similarities(jd_text, resume_texts):
+    """Compute cosine similarity between the JD and each resume using sentence-transformers.
+
+    The model is loaded once and all resumes are encoded in batches; with
+    normalized embeddings the similarities come from a single matrix-vector
+    product.  On a CUDA device the model runs in FP16.
 
-    Returns a float 0.0–1.0, or None if the library is unavailable.
+    Returns a list of floats 0.0–1.0 (one per resume), or None if the
+    library is unavailable.
     """
+    if not resume_texts:
+        return []
     try:
-        from sentence_transformers import SentenceTransformer, util
+        import torch
+        from sentence_transformers import SentenceTransformer
 
-        model = SentenceTransformer("all-MiniLM-L6-v2")
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        model = SentenceTransformer("all-MiniLM-L6-v2", device=device)
+        if device == "cuda":
+            model.half()
         # Truncate long texts to fit model context (max ~256 tokens for speed)
-        jd_chunk = jd_text[:2000]
-        resume_chunk = resume_text[:2000]
-        jd_emb = model.encode(jd_chunk, convert_to_tensor=True)
-        res_emb = model.encode(resume_chunk, convert_to_tensor=True)
-        similarity = util.cos_sim(jd_emb, res_emb).item()
-        return round(similarity, 4)
+        jd_emb = model.encode(
+            jd_text[:2000], convert_to_tensor=True, normalize_embeddings=True,
+        )
+        res_embs = model.encode(
+            [text[:2000] for text in resume_texts],
+            batch_size=32,
+            convert_to_tensor=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        similarities = (res_embs @ jd_emb).tolist()
+        return [round(sim, 4) for sim in similarities]
     except Exception as e:
         print(f"NLP similarity unavailable: {e}", file=sys.stderr)
         return None
@@ -366,11 +481,52 @@ def parse_job_description(jd_path):
 # Main
 # ---------------------------------------------------------------------------
 
+def parse_resume(filename, text, jd, current_year=_CURRENT_YEAR):
+    """Parse one resume's text against the job description.
+
+    Returns ``("excluded", record)`` for overqualified candidates, otherwise
+    ``("candidate", record)``.
+    """
+    # Shared by several extractors below
+    lines = text.split("\n")
+    text_lower = text.lower()
+
+    name = extract_name(text, lines)
+    years = extract_years_of_experience(text, current_year)
+
+    # --- Overqualification exclusion ---
+    max_yrs = jd["max_years_experience"]
+    if max_yrs is not None and years is not None and years > max_yrs:
+        return "excluded", {
+            "filename": filename,
+            "name": name,
+            "years_of_experience": years,
+            "max_allowed": max_yrs,
+            "reason": f"Detected {years} years experience exceeds maximum of {max_yrs} years",
+        }
+
+    return "candidate", {
+        "filename": filename,
+        "name": name,
+        "github_username": extract_github(text),
+        "languages": extract_languages(
+            text, jd["required_languages"] + COMMON_LANGUAGES, text_lower),
+        "frameworks": extract_frameworks(
+            text, jd["required_frameworks"] + COMMON_FRAMEWORKS, text_lower),
+        "years_of_experience": years,
+        "awards": extract_awards(text, lines, text_lower),
+        "education": extract_education(text),
+        "semantic_similarity": None,
+        "raw_text_preview": text[:4000],  # Increased for better self-review
+    }
+
+
 def process_resumes(resume_dir, jd_path, output_path):
     """Process all PDF resumes in a directory and write JSON output."""
     jd = parse_job_description(jd_path)
 
-    # Attempt NLP model load once (shared across candidates)
+    # Check NLP availability up front; the model itself is loaded once,
+    # after extraction, and encodes every candidate in one batched call.
     nlp_available = False
     try:
         from sentence_transformers import SentenceTransformer
@@ -380,52 +536,41 @@ def process_resumes(resume_dir, jd_path, output_path):
         print("sentence-transformers not installed — using keyword-only matching.", file=sys.stderr)
 
     candidates = []
+    candidate_texts = []
     excluded = []
+    current_year = datetime.now().year
 
-    pdf_files = sorted(
-        f for f in os.listdir(resume_dir)
-        if f.lower().endswith(".pdf")
-    )
-
-    for filename in pdf_files:
-        pdf_path = os.path.join(resume_dir, filename)
-        text = extract_text(pdf_path)
-        if not text:
-            print(f"WARNING: Could not extract text from {filename}", file=sys.stderr)
-            continue
-
-        years = extract_years_of_experience(text)
-
-        # --- Overqualification exclusion ---
-        max_yrs = jd["max_years_experience"]
-        if max_yrs is not None and years is not None and years > max_yrs:
-            excluded.append({
-                "filename": filename,
-                "name": extract_name(text),
-                "years_of_experience": years,
-                "max_allowed": max_yrs,
-                "reason": f"Detected {years} years experience exceeds maximum of {max_yrs} years",
-            })
-            continue
-
-        # --- Semantic similarity (if available) ---
-        similarity = None
-        if nlp_available:
-            similarity = compute_semantic_similarity(jd["raw_text"], text)
-
-        candidate = {
-            "filename": filename,
-            "name": extract_name(text),
-            "github_username": extract_github(text),
-            "languages": extract_languages(text, jd["required_languages"] + COMMON_LANGUAGES),
-            "frameworks": extract_frameworks(text, jd["required_frameworks"] + COMMON_FRAMEWORKS),
-            "years_of_experience": years,
-            "awards": extract_awards(text),
-            "education": extract_education(text),
-            "semantic_similarity": similarity,
-            "raw_text_preview": text[:4000],  # Increased for better self-review
-        }
-        candidates.append(candidate)
+    with os.scandir(resume_dir) as it:
+        pdf_entries = sorted(
+            (e.name, e.path) for e in it
+            if e.name.lower().endswith(".pdf") and e.is_file()
+        )
+    pdf_files = [name for name, _ in pdf_entries]
+    pdf_paths = [path for _, path in pdf_entries]
+
+    # PDF parsing is CPU-bound pure Python, so spread it across processes.
+    # pool.map yields texts in order as workers finish them, so the cheap
+    # regex parsing of one resume overlaps with extraction of the next.
+    with ProcessPoolExecutor() as pool:
+        texts = pool.map(extract_text, pdf_paths, chunksize=4)
+        for filename, text in zip(pdf_files, texts):
+            if not text:
+                print(f"WARNING: Could not extract text from {filename}", file=sys.stderr)
+                continue
+
+            kind, record = parse_resume(filename, text, jd, current_year)
+            if kind == "excluded":
+                excluded.append(record)
+            else:
+                candidates.append(record)
+                candidate_texts.append(text)
+
+    # --- Semantic similarity (if available), batched across candidates ---
+    if nlp_available:
+        similarities = compute_semantic_similarities(jd["raw_text"], candidate_texts)
+        if similarities is not None:
+            for candidate, similarity in zip(candidates, similarities):
+                candidate["semantic_similarity"] = similarity
 
     output = {
         "job_description": {
@@ -444,8 +589,20 @@ def process_resumes(resume_dir, jd_path, output_path):
         "nlp_available": nlp_available,
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    # Compact output: indentation roughly doubles the file for no benefit to
+    # the JSON readers downstream.
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(output)
+        except orjson.JSONEncodeError:
+            pass  # e.g. an integer beyond 64 bits; the json module copes
+    if data is not None:
+        with open(output_path, "wb") as f:
+            f.write(data)
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, separators=(",", ":"))
 
     print(f"Scanned {len(pdf_files)} resumes: {len(candidates)} eligible, "
           f"{len(excluded)} excluded (overqualified). Output → {output_path}")
@@ -6,28 +6,67 @@ Searches a codebase for high-signal patterns that indicate potential security vu
 Outputs findings with file paths and line numbers for manual verification.
 
 Usage:
-    python3 pattern_scanner.py <TARGET_DIR> [--lang <LANG>] [--output json|text] [--exclude <PATTERN>]
+    python3 pattern_scanner.py <TARGET_DIR> [--lang <LANG>] [--output json|text|ndjson] [--exclude <PATTERN>]
 
 Examples:
     python3 pattern_scanner.py ./src
     python3 pattern_scanner.py ./src --lang python --output json
+    python3 pattern_scanner.py ./src --output ndjson | jq -c 'select(.severity == "CRITICAL")'
     python3 pattern_scanner.py ./src --exclude "node_modules|vendor|\\.min\\.js"
 """
 
 import argparse
+import functools
 import json
+import mmap
 import os
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import re2
+except ImportError:  # stdlib re: same results, but backtracking
+    re2 = None
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@functools.lru_cache(maxsize=1024)
+def _compile(pattern: str):
+    """Compile *pattern* as a bytes regex, with RE2 when installed.
+
+    Cached, so each distinct pattern string is compiled once per process
+    (including pool workers) however many rules or call sites use it.
+
+    RE2 matches in linear time, so adversarial input (the scanned files are
+    untrusted) cannot trigger catastrophic backtracking.  Patterns RE2 does
+    not support (backreferences, lookaround) fall back to ``re``.  A leading
+    ``(?i)`` is turned into the engine's case-insensitive compile option.
+    """
+    ignore_case = pattern.startswith("(?i)")
+    if ignore_case:
+        pattern = pattern[4:]
+    raw = pattern.encode()
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = not ignore_case
+        # The counted repeats that cap backtracking under ``re`` enlarge the
+        # combined automaton past RE2's default 8 MiB budget, at which point
+        # it drops to its much slower NFA matcher.
+        options.max_mem = 64 << 20
+        try:
+            return re2.compile(raw, options)
+        except re2.error:
+            pass
+    return re.compile(raw, re.IGNORECASE if ignore_case else 0)
+
+@dataclass(slots=True)
 class Finding:
     rule_id: str
     title: str
@@ -40,7 +79,7 @@ class Finding:
     description: str
     category: str          # grouping label
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     rule_id: str
     title: str
@@ -52,6 +91,20 @@ class Rule:
     pattern: str           # regex pattern
     languages: list        # file extensions to search (empty = all)
     exclude_pattern: str = ""  # regex to exclude false positives
+    # Lower-case substrings, at least one of which every match contains;
+    # files containing none of them skip the rule (empty = always run).
+    literal_anchors: list = field(default_factory=list)
+    # Compiled once at import, as bytes patterns so files are scanned
+    # without decoding; an invalid pattern fails loudly here instead of being
+    # skipped silently on every scanned file.
+    regex: re.Pattern = field(init=False, repr=False)
+    exclude_regex: Optional[re.Pattern] = field(init=False, repr=False)
+    anchor_bytes: tuple = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.regex = _compile(self.pattern)
+        self.exclude_regex = _compile(self.exclude_pattern) if self.exclude_pattern else None
+        self.anchor_bytes = tuple(a.encode() for a in self.literal_anchors)
 
 # ---------------------------------------------------------------------------
 # Rule definitions
@@ -63,78 +116,92 @@ RULES: list[Rule] = [
          "Hardcoded Secrets",
          "Password appears to be hardcoded in source code.",
          r"""(?i)(?:password|passwd|pwd)\s*[:=]\s*["'][^"']{4,}["']""",
-         [], r"(?i)example|placeholder|test|dummy|changeme|xxx|\.env\.example"),
+         [], r"(?i)example|placeholder|test|dummy|changeme|xxx|\.env\.example",
+         literal_anchors=["password", "passwd", "pwd"]),
     Rule("SEC-002", "Hardcoded API Key or Token", "CRITICAL", "A02", "CWE-798",
          "Hardcoded Secrets",
          "API key or token appears to be hardcoded in source code.",
          r"""(?i)(?:api[_-]?key|api[_-]?secret|auth[_-]?token|access[_-]?token|secret[_-]?key|private[_-]?key)\s*[:=]\s*["'][A-Za-z0-9+/=_\-]{16,}["']""",
-         [], r"(?i)example|placeholder|test|dummy|xxx|your[_-]"),
+         [], r"(?i)example|placeholder|test|dummy|xxx|your[_-]",
+         literal_anchors=["api", "token", "key"]),
     Rule("SEC-003", "AWS Credentials in Source", "CRITICAL", "A02", "CWE-798",
          "Hardcoded Secrets",
          "AWS access key or secret key found in source code.",
-         r"""(?:AKIA[0-9A-Z]{16}|(?i)aws_secret_access_key\s*[:=]\s*["'][^"']{20,}["'])""",
-         []),
+         r"""(?:AKIA[0-9A-Z]{16}|(?i:aws_secret_access_key)\s*[:=]\s*["'][^"']{20,}["'])""",
+         [],
+         literal_anchors=["akia", "aws_secret_access_key"]),
     Rule("SEC-004", "Private Key in Source", "CRITICAL", "A02", "CWE-321",
          "Hardcoded Secrets",
          "Private key material found in source code.",
          r"""-----BEGIN\s(?:RSA\s)?PRIVATE KEY-----""",
-         []),
+         [],
+         literal_anchors=["private key-----"]),
 
     # --- A02: Weak Cryptography ---
     Rule("SEC-010", "Weak Hash Algorithm (MD5)", "HIGH", "A02", "CWE-327",
          "Weak Cryptography",
          "MD5 is cryptographically broken and should not be used for security purposes.",
          r"""(?i)(?:hashlib\.md5|md5\(|MD5\.Create|MessageDigest\.getInstance\s*\(\s*["']MD5|crypto\.createHash\s*\(\s*["']md5)""",
-         []),
+         [],
+         literal_anchors=["md5"]),
     Rule("SEC-011", "Weak Hash Algorithm (SHA1)", "MEDIUM", "A02", "CWE-327",
          "Weak Cryptography",
          "SHA-1 is deprecated for security use. Use SHA-256 or stronger.",
          r"""(?i)(?:hashlib\.sha1|sha1\(|SHA1\.Create|MessageDigest\.getInstance\s*\(\s*["']SHA-?1|crypto\.createHash\s*\(\s*["']sha1)""",
-         []),
+         [],
+         literal_anchors=["sha1", "sha-1"]),
     Rule("SEC-012", "Insecure Cipher (DES/RC4/ECB)", "HIGH", "A02", "CWE-327",
          "Weak Cryptography",
          "DES, RC4, and ECB mode are insecure encryption methods.",
          r"""(?i)(?:DES/|/ECB/|RC4|Blowfish|DESede|Cipher\.getInstance\s*\(\s*["']DES|AES/ECB)""",
-         []),
+         [],
+         literal_anchors=["des", "/ecb", "rc4", "blowfish"]),
     Rule("SEC-013", "TLS Verification Disabled", "HIGH", "A02", "CWE-295",
          "Weak Cryptography",
          "TLS certificate verification is disabled, allowing MITM attacks.",
          r"""(?i)(?:verify\s*=\s*False|verify_ssl\s*=\s*False|NODE_TLS_REJECT_UNAUTHORIZED\s*=\s*["']0|InsecureSkipVerify\s*:\s*true|CURLOPT_SSL_VERIFYPEER\s*,\s*(?:false|0))""",
-         []),
+         [],
+         literal_anchors=["verify", "node_tls_reject_unauthorized"]),
 
     # --- A03: Injection — SQL ---
     Rule("SEC-020", "Potential SQL Injection (String Concatenation)", "CRITICAL", "A03", "CWE-89",
          "SQL Injection",
          "SQL query appears to be constructed via string concatenation with variables.",
-         r"""(?:execute|query|prepare|cursor\.execute|\.query)\s*\(\s*(?:f["']|["'].*?["']\s*(?:\+|%|\.\s*format))""",
-         [".py", ".js", ".ts", ".java", ".php", ".rb", ".go", ".cs"]),
+         r"""(?:execute|query|prepare|cursor\.execute|\.query)\s*\(\s*(?:f["']|["'].{0,500}?["']\s*(?:\+|%|\.\s*format))""",
+         [".py", ".js", ".ts", ".java", ".php", ".rb", ".go", ".cs"],
+         literal_anchors=["execute", "query", "prepare"]),
     Rule("SEC-021", "SQL Injection (Go fmt.Sprintf)", "CRITICAL", "A03", "CWE-89",
          "SQL Injection",
          "SQL query constructed with fmt.Sprintf is vulnerable to injection.",
          r"""fmt\.Sprintf\s*\(\s*["'](?:SELECT|INSERT|UPDATE|DELETE|DROP|ALTER)\b""",
-         [".go"]),
+         [".go"],
+         literal_anchors=["fmt.sprintf"]),
 
     # --- A03: Injection — Command ---
     Rule("SEC-030", "Command Injection (Python os.system)", "CRITICAL", "A03", "CWE-78",
          "Command Injection",
          "os.system() executes shell commands and is vulnerable to injection.",
          r"""os\.system\s*\(""",
-         [".py"]),
+         [".py"],
+         literal_anchors=["os.system"]),
     Rule("SEC-031", "Command Injection (subprocess shell=True)", "HIGH", "A03", "CWE-78",
          "Command Injection",
          "subprocess with shell=True is vulnerable to command injection.",
-         r"""subprocess\.(?:call|run|Popen|check_output|check_call)\s*\([^)]*shell\s*=\s*True""",
-         [".py"]),
+         r"""subprocess\.(?:call|run|Popen|check_output|check_call)\s*\([^)]{0,500}shell\s*=\s*True""",
+         [".py"],
+         literal_anchors=["subprocess."]),
     Rule("SEC-032", "Command Injection (child_process.exec)", "HIGH", "A03", "CWE-78",
          "Command Injection",
          "child_process.exec passes input through a shell; use execFile instead.",
          r"""(?:child_process\.exec|exec)\s*\(""",
-         [".js", ".ts"], r"(?:execFile|execSync\s*\(\s*[\"'][^\"']*[\"']\s*\))"),
+         [".js", ".ts"], r"(?:execFile|execSync\s*\(\s*[\"'][^\"']*[\"']\s*\))",
+         literal_anchors=["exec"]),
     Rule("SEC-033", "Command Injection (Runtime.exec)", "HIGH", "A03", "CWE-78",
          "Command Injection",
          "Runtime.exec with string argument is vulnerable to command injection.",
          r"""Runtime\.getRuntime\s*\(\s*\)\.exec\s*\(""",
-         [".java"]),
+         [".java"],
+         literal_anchors=["runtime.getruntime"]),
 
     # --- A03: Injection — Code ---
     Rule("SEC-040", "Code Injection (eval)", "HIGH", "A03", "CWE-94",
@@ -142,139 +209,170 @@ RULES: list[Rule] = [
          "eval() executes arbitrary code and is dangerous with any user input.",
          r"""\beval\s*\(""",
          [".py", ".js", ".ts", ".rb", ".php"],
-         r"(?i)(?:eslint|jshint|noinspection|# noqa)"),
+         r"(?i)(?:eslint|jshint|noinspection|# noqa)",
+         literal_anchors=["eval"]),
     Rule("SEC-041", "Code Injection (exec in Python)", "HIGH", "A03", "CWE-94",
          "Code Injection",
          "exec() executes arbitrary Python code.",
          r"""\bexec\s*\(""",
-         [".py"]),
+         [".py"],
+         literal_anchors=["exec"]),
 
     # --- A03: Injection — XSS ---
     Rule("SEC-050", "XSS via innerHTML", "MEDIUM", "A03", "CWE-79",
          "Cross-Site Scripting",
          "innerHTML assignment can introduce XSS if value contains user input.",
          r"""\.innerHTML\s*=""",
-         [".js", ".ts", ".jsx", ".tsx", ".vue"]),
+         [".js", ".ts", ".jsx", ".tsx", ".vue"],
+         literal_anchors=[".innerhtml"]),
     Rule("SEC-051", "XSS via dangerouslySetInnerHTML", "MEDIUM", "A03", "CWE-79",
          "Cross-Site Scripting",
          "dangerouslySetInnerHTML bypasses React's XSS protection.",
          r"""dangerouslySetInnerHTML""",
-         [".js", ".ts", ".jsx", ".tsx"]),
+         [".js", ".ts", ".jsx", ".tsx"],
+         literal_anchors=["dangerouslysetinnerhtml"]),
     Rule("SEC-052", "XSS via document.write", "MEDIUM", "A03", "CWE-79",
          "Cross-Site Scripting",
          "document.write can introduce XSS vulnerabilities.",
          r"""document\.write\s*\(""",
-         [".js", ".ts", ".html"]),
+         [".js", ".ts", ".html"],
+         literal_anchors=["document.write"]),
 
     # --- A03: Injection — Template ---
     Rule("SEC-060", "Server-Side Template Injection (Python)", "HIGH", "A03", "CWE-1336",
          "Template Injection",
          "render_template_string with user input enables SSTI.",
          r"""render_template_string\s*\(""",
-         [".py"]),
+         [".py"],
+         literal_anchors=["render_template_string"]),
     Rule("SEC-061", "Jinja2 Autoescape Disabled", "MEDIUM", "A03", "CWE-79",
          "Template Injection",
          "Jinja2 Environment with autoescape disabled allows XSS.",
-         r"""Environment\s*\([^)]*autoescape\s*=\s*False""",
-         [".py"]),
+         r"""Environment\s*\([^)]{0,500}autoescape\s*=\s*False""",
+         [".py"],
+         literal_anchors=["autoescape"]),
 
     # --- A05: Security Misconfiguration ---
     Rule("SEC-070", "Debug Mode Enabled", "MEDIUM", "A05", "CWE-489",
          "Security Misconfiguration",
          "Debug mode should be disabled in production deployments.",
          r"""(?i)(?:DEBUG\s*=\s*True|debug\s*:\s*true|app\.debug\s*=\s*True|NODE_ENV\s*[:=]\s*["']?development)""",
-         [".py", ".js", ".ts", ".env", ".yaml", ".yml", ".json", ".toml"]),
+         [".py", ".js", ".ts", ".env", ".yaml", ".yml", ".json", ".toml"],
+         literal_anchors=["debug", "node_env"]),
     Rule("SEC-071", "Stack Trace Exposure", "LOW", "A05", "CWE-209",
          "Security Misconfiguration",
          "Stack traces may expose internal details to attackers.",
          r"""(?i)(?:traceback\.print_exc|e\.printStackTrace|\.stack\s|print_r\s*\(\s*\$e|full_exception_chain)""",
-         [".py", ".java", ".php", ".js", ".ts"]),
+         [".py", ".java", ".php", ".js", ".ts"],
+         literal_anchors=["traceback.print_exc", "printstacktrace", ".stack", "print_r", "full_exception_chain"]),
 
     # --- A07: Authentication Failures ---
     Rule("SEC-080", "Insecure Randomness", "MEDIUM", "A07", "CWE-330",
          "Authentication Failures",
          "Math.random() / random.random() are not cryptographically secure for tokens.",
          r"""(?:Math\.random\s*\(\)|random\.random\s*\(\)|random\.randint\s*\(|rand\(\))""",
-         [".py", ".js", ".ts", ".rb", ".php"]),
+         [".py", ".js", ".ts", ".rb", ".php"],
+         literal_anchors=["random", "rand("]),
 
     # --- A08: Integrity Failures — Deserialization ---
     Rule("SEC-090", "Insecure Deserialization (pickle)", "CRITICAL", "A08", "CWE-502",
          "Insecure Deserialization",
          "pickle.loads on untrusted data can lead to arbitrary code execution.",
          r"""pickle\.loads?\s*\(""",
-         [".py"]),
+         [".py"],
+         literal_anchors=["pickle.load"]),
     Rule("SEC-091", "Insecure Deserialization (YAML unsafe)", "HIGH", "A08", "CWE-502",
          "Insecure Deserialization",
          "yaml.load without SafeLoader can execute arbitrary Python objects.",
          r"""yaml\.(?:load|unsafe_load)\s*\(""",
-         [".py"], r"Loader\s*=\s*(?:Safe|Base)Loader"),
+         [".py"], r"Loader\s*=\s*(?:Safe|Base)Loader",
+         literal_anchors=["yaml.load", "yaml.unsafe_load"]),
     Rule("SEC-092", "Insecure Deserialization (Java ObjectInputStream)", "HIGH", "A08", "CWE-502",
          "Insecure Deserialization",
          "ObjectInputStream.readObject() on untrusted data is dangerous.",
-         r"""ObjectInputStream.*readObject\s*\(|new\s+ObjectInputStream""",
-         [".java"]),
+         r"""ObjectInputStream.{0,500}readObject\s*\(|new\s+ObjectInputStream""",
+         [".java"],
+         literal_anchors=["objectinputstream"]),
     Rule("SEC-093", "Insecure Deserialization (PHP unserialize)", "HIGH", "A08", "CWE-502",
          "Insecure Deserialization",
          "unserialize() on untrusted data can lead to object injection.",
          r"""unserialize\s*\(""",
-         [".php"]),
+         [".php"],
+         literal_anchors=["unserialize"]),
     Rule("SEC-094", "Insecure Deserialization (.NET BinaryFormatter)", "HIGH", "A08", "CWE-502",
          "Insecure Deserialization",
          "BinaryFormatter.Deserialize on untrusted data is dangerous.",
-         r"""BinaryFormatter.*Deserialize|new\s+BinaryFormatter""",
-         [".cs"]),
+         r"""BinaryFormatter.{0,500}Deserialize|new\s+BinaryFormatter""",
+         [".cs"],
+         literal_anchors=["binaryformatter"]),
 
     # --- A10: SSRF ---
     Rule("SEC-100", "Potential SSRF (Python requests)", "MEDIUM", "A10", "CWE-918",
          "SSRF",
          "Server-side HTTP request with potentially user-controlled URL.",
          r"""requests\.(?:get|post|put|delete|patch|head)\s*\(""",
-         [".py"]),
+         [".py"],
+         literal_anchors=["requests."]),
     Rule("SEC-101", "Potential SSRF (Node fetch/axios)", "MEDIUM", "A10", "CWE-918",
          "SSRF",
          "Server-side HTTP request with potentially user-controlled URL.",
          r"""(?:fetch|axios\.(?:get|post|put|delete|patch))\s*\(""",
-         [".js", ".ts"]),
+         [".js", ".ts"],
+         literal_anchors=["fetch", "axios."]),
     Rule("SEC-102", "Potential SSRF (Java)", "MEDIUM", "A10", "CWE-918",
          "SSRF",
          "Server-side HTTP request with potentially user-controlled URL.",
          r"""(?:URL\s*\(|HttpURLConnection|HttpClient\.send|WebClient)""",
-         [".java"]),
+         [".java"],
+         literal_anchors=["url", "httpclient.send", "webclient"]),
     Rule("SEC-103", "Potential SSRF (Go)", "MEDIUM", "A10", "CWE-918",
          "SSRF",
          "Server-side HTTP request with potentially user-controlled URL.",
          r"""http\.(?:Get|Post|Head)\s*\(""",
-         [".go"]),
+         [".go"],
+         literal_anchors=["http.get", "http.post", "http.head"]),
 
     # --- A01: Broken Access Control — CORS ---
     Rule("SEC-110", "Permissive CORS Configuration", "MEDIUM", "A01", "CWE-942",
          "Access Control",
          "CORS wildcard (*) may allow unintended cross-origin access.",
-         r"""(?i)(?:Access-Control-Allow-Origin\s*[:=]\s*["']\*|cors\(\s*\{[^}]*origin\s*:\s*(?:true|["']\*))""",
-         []),
+         r"""(?i)(?:Access-Control-Allow-Origin\s*[:=]\s*["']\*|cors\(\s*\{[^}]{0,500}origin\s*:\s*(?:true|["']\*))""",
+         [],
+         literal_anchors=["access-control-allow-origin", "cors("]),
 
     # --- A04: Insecure Design ---
     Rule("SEC-120", "Missing CSRF Token Check", "MEDIUM", "A04", "CWE-352",
          "Insecure Design",
          "POST/PUT/DELETE endpoint without apparent CSRF protection.",
-         r"""(?i)(?:@csrf_exempt|csrf\s*:\s*false|disable.*csrf)""",
-         [".py", ".js", ".ts", ".java", ".php", ".rb"]),
+         r"""(?i)(?:@csrf_exempt|csrf\s*:\s*false|disable.{0,500}csrf)""",
+         [".py", ".js", ".ts", ".java", ".php", ".rb"],
+         literal_anchors=["csrf"]),
 
     # --- File operations ---
     Rule("SEC-130", "Path Traversal Risk", "MEDIUM", "A01", "CWE-22",
          "Path Traversal",
          "File operation with potentially user-controlled path.",
-         r"""(?:open\s*\(.*(?:request|req|params|args|input)|fs\.(?:readFile|writeFile|createReadStream)\s*\(.*(?:req|params|query))""",
-         [".py", ".js", ".ts"]),
+         r"""(?:open\s*\(.{0,500}(?:request|req|params|args|input)|fs\.(?:readFile|writeFile|createReadStream)\s*\(.{0,500}(?:req|params|query))""",
+         [".py", ".js", ".ts"],
+         literal_anchors=["open", "fs."]),
 
     # --- Logging ---
     Rule("SEC-140", "Sensitive Data in Logs", "MEDIUM", "A09", "CWE-532",
          "Logging Failures",
          "Logging statement that may include sensitive data (password, token, secret).",
-         r"""(?i)(?:log(?:ger)?\.(?:info|warn|debug|error|log)|console\.log|print)\s*\([^)]*(?:password|token|secret|api.key|credit.card|ssn)""",
-         []),
+         r"""(?i)(?:log(?:ger)?\.(?:info|warn|debug|error|log)|console\.log|print)\s*\([^)]{0,500}(?:password|token|secret|api.key|credit.card|ssn)""",
+         [],
+         literal_anchors=["log", "print"]),
 ]
 
+# Rules applicable to each extension, resolved once: rules without a
+# language list apply everywhere, so they appear in every entry.
+UNIVERSAL_RULES: list[Rule] = [r for r in RULES if not r.languages]
+RULES_BY_EXT: dict[str, list[Rule]] = {
+    ext: [r for r in RULES if not r.languages or ext in r.languages]
+    for ext in {ext for r in RULES for ext in r.languages}
+}
+
 # ---------------------------------------------------------------------------
 # File extension mapping
 # ---------------------------------------------------------------------------
@@ -299,19 +397,20 @@ BINARY_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".ico", ".woff", ".woff2",
                      ".eot", ".otf", ".zip", ".gz", ".tar", ".jar", ".war", ".class",
                      ".pyc", ".pyo", ".o", ".so", ".dll", ".exe", ".pdf", ".mp3", ".mp4"}
 
-SKIP_DIRS = {"node_modules", ".git", ".svn", "__pycache__", ".tox", ".venv", "venv",
-             "vendor", "dist", "build", ".next", ".nuxt", "target", "bin", "obj",
-             ".idea", ".vscode", ".gradle", ".m2"}
+SKIP_DIRS = frozenset({"node_modules", ".git", ".svn", "__pycache__", ".tox", ".venv", "venv",
+                       "vendor", "dist", "build", ".next", ".nuxt", "target", "bin", "obj",
+                       ".idea", ".vscode", ".gradle", ".m2"})
 
 # ---------------------------------------------------------------------------
 # Scanner logic
 # ---------------------------------------------------------------------------
 
-def should_skip_dir(dirname: str) -> bool:
-    return dirname in SKIP_DIRS or dirname.startswith(".")
+def file_suffix(name: str) -> str:
+    """Lower-cased extension of *name*, following ``Path.suffix`` rules."""
+    i = name.rfind(".")
+    return name[i:].lower() if 0 < i < len(name) - 1 else ""
 
-def should_scan_file(filepath: Path, lang_filter: Optional[str]) -> bool:
-    ext = filepath.suffix.lower()
+def should_scan_file(ext: str, lang_filter: Optional[str]) -> bool:
     if ext in BINARY_EXTENSIONS:
         return False
     if lang_filter:
@@ -319,82 +418,227 @@ def should_scan_file(filepath: Path, lang_filter: Optional[str]) -> bool:
         return ext in allowed
     return True
 
-def rule_applies(rule: Rule, filepath: Path) -> bool:
-    if not rule.languages:
-        return True
-    return filepath.suffix.lower() in rule.languages
+def rules_for(ext: str) -> list[Rule]:
+    """Rules that apply to files with the (lower-cased) extension *ext*."""
+    return RULES_BY_EXT.get(ext, UNIVERSAL_RULES)
+
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?([imsx]+)\)")
+
+# Files at least this large are memory-mapped rather than read into memory.
+MMAP_THRESHOLD = 64 * 1024
+# Like grep, a NUL byte in this many leading bytes marks a file as binary.
+BINARY_PROBE_SIZE = 8 * 1024
+# mmap spans are counted and prefiltered through slices of at most this size.
+COUNT_CHUNK_SIZE = 1024 * 1024
+# What str.strip() removes from an ASCII string, so ASCII lines can be
+# trimmed and truncated as bytes before anything is decoded.
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+def _scoped(pattern: str) -> str:
+    """Wrap *pattern* in a group, turning a leading global flag like ``(?i)``
+    into a scoped ``(?i:...)`` so it can sit inside an alternation."""
+    m = _GLOBAL_FLAGS_RE.match(pattern)
+    if m:
+        return f"(?{m.group(1)}:{pattern[m.end():]})"
+    return f"(?:{pattern})"
+
+@functools.lru_cache(maxsize=1024)
+def _combined_regex(patterns: tuple[str, ...]) -> re.Pattern:
+    """One alternation of *patterns*, cached per distinct set of rules.
+
+    The set varies with which literal anchors a file contains, so the cache
+    is bounded.
+    """
+    return _compile("|".join(_scoped(p) for p in patterns))
 
 def scan_file(filepath: Path, rules: list[Rule]) -> list[Finding]:
-    findings = []
+    """Scan one file with *rules*, which should already be those returned
+    by ``rules_for`` for its extension."""
+    if not rules:
+        return []
     try:
-        content = filepath.read_text(errors="replace")
+        with open(filepath, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size < MMAP_THRESHOLD:
+                return _scan_buffer(fh.read(), filepath, rules)
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return _scan_buffer(content, filepath, rules)
     except (PermissionError, OSError):
-        return findings
+        return []
+
+def _count_newlines(content, start: int, end: int) -> int:
+    """Count b"\\n" in ``content[start:end]`` for ``bytes`` or ``mmap``."""
+    if isinstance(content, bytes):
+        return content.count(b"\n", start, end)
+    # mmap has no count(); copy out bounded slices rather than the whole span
+    return sum(content[i:min(i + COUNT_CHUNK_SIZE, end)].count(b"\n")
+               for i in range(start, end, COUNT_CHUNK_SIZE))
+
+def _present_anchors(content, anchors: set) -> set:
+    """The members of *anchors* (lower-case bytes) that occur in *content*,
+    ignoring ASCII case."""
+    if isinstance(content, bytes):
+        lowered = content.lower()
+        return {a for a in anchors if a in lowered}
+    # Lower-case bounded slices of an mmap instead of copying the whole file;
+    # consecutive slices overlap so an anchor across a boundary is still seen.
+    found = set()
+    missing = set(anchors)
+    overlap = max(map(len, anchors), default=1) - 1
+    size = len(content)
+    for i in range(0, size, COUNT_CHUNK_SIZE):
+        chunk = content[i:min(i + COUNT_CHUNK_SIZE + overlap, size)].lower()
+        hits = {a for a in missing if a in chunk}
+        found |= hits
+        missing -= hits
+        if not missing:
+            break
+    return found
+
+def _snippet(line: bytes) -> str:
+    """The stripped first 200 characters of *line*, as reported in findings."""
+    if line.isascii():
+        # One byte per character: trim and cut before decoding, so at most
+        # 200 bytes are copied whatever the line length.
+        return line.strip(_ASCII_WHITESPACE)[:200].decode("ascii")
+    return line.decode("utf-8", "replace").strip()[:200]
+
+def _scan_buffer(content, filepath: Path, rules: list[Rule]) -> list[Finding]:
+    """Scan raw file *content* (``bytes`` or ``mmap``) with *rules*.
+
+    Only the lines that produce findings are decoded.
+    """
+    findings = []
+    if content.find(b"\0", 0, BINARY_PROBE_SIZE) != -1:
+        return findings  # binary file without a known binary extension
+    if re2 is None:
+        # Cheap prefilter for the backtracking engine: bytes.__contains__
+        # runs in C at memory speed, so drop every rule none of whose
+        # literal anchors occur in the file.  RE2 already runs the combined
+        # automaton at that speed, and per-file rule subsets would only
+        # force it to recompile.
+        present = _present_anchors(content, {a for rule in rules for a in rule.anchor_bytes})
+        rules = [rule for rule in rules
+                 if not rule.anchor_bytes or not present.isdisjoint(rule.anchor_bytes)]
+        if not rules:
+            return findings
+
+    # The combined pattern is searched over the whole buffer, so lines with
+    # no hit are never materialised.  Each hit's line is then checked rule
+    # by rule (one finding per rule per line, as before) and the search
+    # resumes on the next line, so a hit spanning a newline cannot hide a
+    # match on the line after it.
+    any_rule = _combined_regex(tuple(rule.pattern for rule in rules))
+    line_no = 1
+    counted = 0  # newlines before this offset are included in line_no
+    pos = 0
+    while (m := any_rule.search(content, pos)) is not None:
+        off = m.start()
+        # Hits arrive in increasing order, so counting only the gap since
+        # the previous hit touches each byte at most once; a C-level count
+        # beats indexing every line up front however dense the hits are.
+        line_no += _count_newlines(content, counted, off)
+        counted = off
+        start = content.rfind(b"\n", 0, off) + 1
+        end = content.find(b"\n", off)
+        if end == -1:
+            end = len(content)
+        pos = end + 1
+        if end > start and content[end - 1] == 0x0D:
+            end -= 1  # CRLF line, as text-mode reading used to give
+        line = content[start:end]
+        matched_text = None
+        for rule in rules:
+            if not rule.regex.search(line):
+                continue
+            # Check exclusion pattern
+            if rule.exclude_regex is not None and rule.exclude_regex.search(line):
+                continue
+            if matched_text is None:
+                matched_text = _snippet(line)
+            findings.append(Finding(
+                rule_id=rule.rule_id,
+                title=rule.title,
+                severity=rule.severity,
+                owasp=rule.owasp,
+                cwe=rule.cwe,
+                file=str(filepath),
+                line=line_no,
+                matched_text=matched_text,
+                description=rule.description,
+                category=rule.category,
+            ))
+    return findings
 
-    lines = content.split("\n")
-    for rule in rules:
-        if not rule_applies(rule, filepath):
-            continue
+def _walk_files(root: str):
+    """Yield ``(entry, rel_path)`` for every regular file under *root*.
+
+    Uses ``os.scandir`` directly so the cached ``DirEntry`` type information
+    answers every is-dir/is-file question, and pruned directories are never
+    opened.  Like ``os.walk``, symlinked directories are not followed.
+    """
+    stack = [(root, "")]
+    while stack:
+        dirpath, rel_dir = stack.pop()
         try:
-            pattern = re.compile(rule.pattern)
-        except re.error:
+            it = os.scandir(dirpath)
+        except OSError:
             continue
-        for i, line in enumerate(lines, start=1):
-            if pattern.search(line):
-                # Check exclusion pattern
-                if rule.exclude_pattern:
-                    try:
-                        if re.search(rule.exclude_pattern, line):
-                            continue
-                    except re.error:
-                        pass
-                findings.append(Finding(
-                    rule_id=rule.rule_id,
-                    title=rule.title,
-                    severity=rule.severity,
-                    owasp=rule.owasp,
-                    cwe=rule.cwe,
-                    file=str(filepath),
-                    line=i,
-                    matched_text=line.strip()[:200],
-                    description=rule.description,
-                    category=rule.category,
-                ))
-    return findings
-
-def scan_directory(target: str, lang_filter: Optional[str],
-                   exclude_pattern: Optional[str]) -> list[Finding]:
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name
+                    # Hidden and SKIP_DIRS directories are never descended into.
+                    if name[:1] != "." and name not in SKIP_DIRS:
+                        stack.append((entry.path, rel_dir + name + os.sep))
+                elif entry.is_file():
+                    yield entry, rel_dir + entry.name
+
+def _scan_path(filepath: Path, ext: str) -> list[Finding]:
+    """Process-pool entry point: scan *filepath* with the rules for *ext*."""
+    return scan_file(filepath, rules_for(ext))
+
+def iter_findings(target: str, lang_filter: Optional[str],
+                  exclude_pattern: Optional[str]) -> Iterator[Finding]:
+    """Yield findings file by file, in walk order, as the pool produces them."""
     target_path = Path(target).resolve()
     if not target_path.exists():
         print(f"Error: target '{target}' does not exist.", file=sys.stderr)
         sys.exit(1)
 
     exclude_re = re.compile(exclude_pattern) if exclude_pattern else None
-    all_findings: list[Finding] = []
 
     if target_path.is_file():
-        return scan_file(target_path, RULES)
-
-    for dirpath, dirnames, filenames in os.walk(target_path):
-        # Skip irrelevant directories
-        dirnames[:] = [d for d in dirnames if not should_skip_dir(d)]
-
-        for filename in filenames:
-            filepath = Path(dirpath) / filename
-            rel_path = filepath.relative_to(target_path)
+        yield from scan_file(target_path, rules_for(target_path.suffix.lower()))
+        return
+
+    filepaths: list[Path] = []
+    exts: list[str] = []
+    rel_paths: list[str] = []
+    for entry, rel_path in _walk_files(str(target_path)):
+        # Filter on plain strings; a Path is only built for files to scan
+        ext = file_suffix(entry.name)
+        if not should_scan_file(ext, lang_filter):
+            continue
+        if exclude_re and exclude_re.search(rel_path):
+            continue
 
-            if exclude_re and exclude_re.search(str(rel_path)):
-                continue
-            if not should_scan_file(filepath, lang_filter):
-                continue
+        filepaths.append(Path(entry.path))
+        exts.append(ext)
+        rel_paths.append(rel_path)
 
-            findings = scan_file(filepath, RULES)
+    # Files are independent and regex matching is CPU-bound, so spread them
+    # across processes; results come back in walk order.
+    with ProcessPoolExecutor() as pool:
+        results = pool.map(_scan_path, filepaths, exts, chunksize=32)
+        for rel_path, findings in zip(rel_paths, results):
             # Store relative paths for cleaner output
             for f in findings:
-                f.file = str(rel_path)
-            all_findings.extend(findings)
+                f.file = rel_path
+            yield from findings
 
-    return all_findings
+def scan_directory(target: str, lang_filter: Optional[str],
+                   exclude_pattern: Optional[str]) -> list[Finding]:
+    return list(iter_findings(target, lang_filter, exclude_pattern))
 
 # ---------------------------------------------------------------------------
 # Output formatting
@@ -402,19 +646,23 @@ def scan_directory(target: str, lang_filter: Optional[str],
 
 SEVERITY_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4}
 
-def format_text(findings: list[Finding]) -> str:
+def sort_findings(findings: list[Finding]) -> Counter:
+    """Sort *findings* in place for output and return their severity counts.
+
+    Both formatters expect findings in this order, so it is done once here.
+    """
+    order = SEVERITY_ORDER.get
+    findings.sort(key=lambda f: (order(f.severity, 5), f.rule_id, f.file, f.line))
+    return Counter(f.severity for f in findings)
+
+def format_text(findings: list[Finding], counts: Counter) -> str:
     if not findings:
         return "✅ No potential vulnerabilities detected by automated pattern scan.\n"
 
-    findings.sort(key=lambda f: (SEVERITY_ORDER.get(f.severity, 5), f.rule_id, f.file, f.line))
-
     # Summary
-    counts = {}
-    for f in findings:
-        counts[f.severity] = counts.get(f.severity, 0) + 1
-    summary_parts = [f"{sev}: {counts.get(sev, 0)}"
+    summary_parts = [f"{sev}: {counts[sev]}"
                      for sev in ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]
-                     if counts.get(sev, 0) > 0]
+                     if counts[sev] > 0]
 
     lines = [
         f"🔍 Pattern Scan Results — {len(findings)} potential finding(s)",
@@ -439,11 +687,10 @@ def format_text(findings: list[Finding]) -> str:
         )
     return "\n".join(lines)
 
-def format_json(findings: list[Finding]) -> str:
-    findings.sort(key=lambda f: (SEVERITY_ORDER.get(f.severity, 5), f.rule_id, f.file, f.line))
+def format_json(findings: list[Finding], counts: Counter) -> str:
     return json.dumps({
         "total": len(findings),
-        "counts": {sev: sum(1 for f in findings if f.severity == sev)
+        "counts": {sev: counts[sev]
                    for sev in ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]},
         "findings": [asdict(f) for f in findings],
     }, indent=2)
@@ -458,18 +705,25 @@ def main():
     parser.add_argument("target", help="Directory or file to scan")
     parser.add_argument("--lang", choices=list(LANG_EXTENSIONS.keys()),
                         help="Filter to a specific language")
-    parser.add_argument("--output", choices=["text", "json"], default="text",
-                        help="Output format (default: text)")
+    parser.add_argument("--output", choices=["text", "json", "ndjson"], default="text",
+                        help="Output format (default: text); ndjson streams one "
+                             "unsorted finding per line as files are scanned")
     parser.add_argument("--exclude", type=str, default=None,
                         help="Regex pattern to exclude files/directories")
     args = parser.parse_args()
 
+    if args.output == "ndjson":
+        for f in iter_findings(args.target, args.lang, args.exclude):
+            print(json.dumps(asdict(f)))
+        return
+
     findings = scan_directory(args.target, args.lang, args.exclude)
+    counts = sort_findings(findings)
 
     if args.output == "json":
-        print(format_json(findings))
+        print(format_json(findings, counts))
     else:
-        print(format_text(findings))
+        print(format_text(findings, counts))
 
 if __name__ == "__main__":
     main()